@@ -1,10 +1,14 @@
 from uuid import UUID, uuid4
 
+from asynctest.mock import patch
+
 from tests.testmodels import UniqueName, UUIDPkModel
 from tortoise.contrib import test
 from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
+CHUNK_PARAMETERS = "tortoise.backends.asyncpg.executor.AsyncpgExecutor.BULK_INSERT_MAX_PARAMETERS"
+
 
 class TestBulk(test.TruncationTestCase):
     async def test_bulk_create(self):
@@ -13,6 +17,45 @@ class TestBulk(test.TruncationTestCase):
         inc = all_[0]["id"]
         self.assertEqual(all_, [{"id": val + inc, "name": None} for val in range(1000)])
 
+    @test.requireCapability(dialect="postgres")
+    async def test_bulk_create_populates_pk(self):
+        objs = [UniqueName(name=str(i)) for i in range(10)]
+        await UniqueName.bulk_create(objs)
+        all_ = await UniqueName.all().values_list("id", flat=True)
+        self.assertEqual(sorted(all_), [obj.pk for obj in objs])
+
+    @test.requireCapability(dialect="postgres")
+    async def test_bulk_create_populates_pk_chunked(self):
+        objs = [UniqueName(name=str(i)) for i in range(10)]
+        with patch(CHUNK_PARAMETERS, 4):
+            await UniqueName.bulk_create(objs)
+        all_ = await UniqueName.all().order_by("id").values_list("id", "name")
+        self.assertEqual(all_, [(obj.pk, obj.name) for obj in objs])
+
+    @test.requireCapability(dialect="postgres")
+    async def test_bulk_create_populates_pk_chunked_in_transaction(self):
+        objs = [UniqueName(name=str(i)) for i in range(10)]
+        with patch(CHUNK_PARAMETERS, 4):
+            async with in_transaction():
+                await UniqueName.bulk_create(objs)
+        all_ = await UniqueName.all().order_by("id").values_list("id", "name")
+        self.assertEqual(all_, [(obj.pk, obj.name) for obj in objs])
+
+    @test.requireCapability(dialect="postgres")
+    async def test_bulk_create_chunked_fail_rolls_back(self):
+        with patch(CHUNK_PARAMETERS, 4):
+            with self.assertRaises(IntegrityError):
+                await UniqueName.bulk_create(
+                    [UniqueName(name=str(i)) for i in range(6)] + [UniqueName(name="0")]
+                )
+        self.assertEqual(await UniqueName.all().count(), 0)
+
+    async def test_bulk_create_single_connection(self):
+        db = UniqueName._meta.db
+        with patch.object(db, "acquire_connection", wraps=db.acquire_connection) as acquire:
+            await UniqueName.bulk_create([UniqueName() for _ in range(100)])
+        self.assertEqual(acquire.call_count, 1)
+
     async def test_bulk_create_uuidpk(self):
         await UUIDPkModel.bulk_create([UUIDPkModel() for _ in range(1000)])
         res = await UUIDPkModel.all().values_list("id", flat=True)
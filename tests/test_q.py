@@ -1,9 +1,11 @@
 from unittest import TestCase as _TestCase
 
+from pypika import Table
+
 from tests.testmodels import CharFields, IntFields
 from tortoise.contrib.test import TestCase
 from tortoise.exceptions import OperationalError
-from tortoise.query_utils import Q
+from tortoise.query_utils import Q, QueryModifier
 
 
 class TestQ(_TestCase):
@@ -201,3 +203,49 @@ class TestQCall(TestCase):
         q = Q() | Q(id__gt=5)
         r = q.resolve(CharFields, {}, {})
         self.assertEqual(r.where_criterion.get_sql(), '"id">5')
+
+
+class TestQueryModifier(_TestCase):
+    def setUp(self):
+        table = Table("t")
+        self.joined = Table("j")
+        self.modifiers = [
+            QueryModifier(where_criterion=table.a == 1),
+            QueryModifier(),
+            QueryModifier(where_criterion=table.b == 2, joins=[(self.joined, table.id == 1)]),
+            QueryModifier(having_criterion=table.c > 3),
+        ]
+
+    def test_combine_and(self):
+        folded = QueryModifier()
+        for modifier in self.modifiers:
+            folded &= modifier
+        combined = QueryModifier.combine_and(self.modifiers)
+
+        self.assertEqual(combined.where_criterion.get_sql(), folded.where_criterion.get_sql())
+        self.assertEqual(combined.having_criterion.get_sql(), folded.having_criterion.get_sql())
+        self.assertEqual(combined.joins, folded.joins)
+
+    def test_combine_or(self):
+        folded = QueryModifier()
+        for modifier in self.modifiers:
+            folded |= modifier
+        combined = QueryModifier.combine_or(self.modifiers)
+
+        self.assertFalse(combined.where_criterion)
+        self.assertEqual(combined.having_criterion.get_sql(), folded.having_criterion.get_sql())
+        self.assertEqual(combined.joins, folded.joins)
+
+    def test_combine_or_without_having(self):
+        folded = QueryModifier()
+        for modifier in self.modifiers[:3]:
+            folded |= modifier
+        combined = QueryModifier.combine_or(self.modifiers[:3])
+
+        self.assertEqual(combined.where_criterion.get_sql(), folded.where_criterion.get_sql())
+        self.assertFalse(combined.having_criterion)
+        self.assertEqual(combined.joins, folded.joins)
+
+    def test_combine_empty(self):
+        self.assertFalse(QueryModifier.combine_and([]).where_criterion)
+        self.assertFalse(QueryModifier.combine_or([]).where_criterion)
@@ -1,6 +1,6 @@
 import asyncio
 from functools import wraps
-from typing import List, Optional, SupportsInt, Union
+from typing import List, Optional, SupportsInt, Tuple, Union
 
 import asyncpg
 from asyncpg.transaction import Transaction
@@ -130,7 +130,8 @@ class AsyncpgDBClient(BaseDBAsyncClient):
     async def execute_insert(self, query: str, values: list) -> Optional[asyncpg.Record]:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
-            # TODO: Cache prepared statement
+            # The insert SQL is built once per model by the executor, so asyncpg's
+            # per-connection statement cache only has to prepare it once.
             return await connection.fetchrow(query, *values)
 
     @translate_exceptions
@@ -148,12 +149,32 @@ class AsyncpgDBClient(BaseDBAsyncClient):
             else:
                 await transaction.commit()
 
+    @translate_exceptions
+    async def execute_many_returning(self, queries: List[Tuple[str, list]]) -> List[asyncpg.Record]:
+        async with self.acquire_connection() as connection:
+            if len(queries) == 1:
+                query, values = queries[0]
+                self.log.debug("%s: %s", query, values)
+                return await connection.fetch(query, *values)
+            results: List[asyncpg.Record] = []
+            transaction = connection.transaction()
+            await transaction.start()
+            try:
+                for query, values in queries:
+                    self.log.debug("%s: %s", query, values)
+                    results.extend(await connection.fetch(query, *values))
+            except Exception:
+                await transaction.rollback()
+                raise
+            else:
+                await transaction.commit()
+            return results
+
     @translate_exceptions
     async def execute_query(self, query: str, values: Optional[list] = None) -> List[dict]:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
             if values:
-                # TODO: Cache prepared statement
                 return await connection.fetch(query, *values)
             return await connection.fetch(query)
 
@@ -162,7 +183,6 @@ class AsyncpgDBClient(BaseDBAsyncClient):
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
             if values:
-                # TODO: Cache prepared statement
                 return list(map(dict, await connection.fetch(query, *values)))
             return list(map(dict, await connection.fetch(query)))
 
@@ -196,6 +216,15 @@ class TransactionWrapper(AsyncpgDBClient, BaseTransactionWrapper):
             # TODO: Consider using copy_records_to_table instead
             await connection.executemany(query, values)
 
+    @translate_exceptions
+    async def execute_many_returning(self, queries: List[Tuple[str, list]]) -> List[asyncpg.Record]:
+        async with self.acquire_connection() as connection:
+            results: List[asyncpg.Record] = []
+            for query, values in queries:
+                self.log.debug("%s: %s", query, values)
+                results.extend(await connection.fetch(query, *values))
+            return results
+
     @translate_exceptions
     async def start(self) -> None:
         self.transaction = self._connection.transaction()
@@ -1,5 +1,5 @@
 import uuid
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, cast
 
 import asyncpg
 from pypika import Parameter
@@ -7,10 +7,19 @@ from pypika import Parameter
 from tortoise import Model
 from tortoise.backends.base.executor import BaseExecutor
 
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.asyncpg.client import AsyncpgDBClient
+
+BULK_INSERT_CACHE: Dict[str, str] = {}
+
 
 class AsyncpgExecutor(BaseExecutor):
     EXPLAIN_PREFIX = "EXPLAIN (FORMAT JSON, VERBOSE)"
     DB_NATIVE = BaseExecutor.DB_NATIVE | {uuid.UUID}
+    # PostgreSQL limits a single statement to 32767 bind parameters
+    BULK_INSERT_MAX_PARAMETERS = 32767
+    # Keep multi-row statements small enough to stay cheap to build and parse
+    BULK_INSERT_MAX_ROWS = 1000
 
     def Parameter(self, pos: int) -> Parameter:
         return Parameter("$%d" % (pos + 1,))
@@ -26,9 +35,58 @@ class AsyncpgExecutor(BaseExecutor):
             query = query.returning(*generated_fields)
         return str(query)
 
+    def _prepare_bulk_insert_statement(self, rows: int) -> str:
+        column_count = len(self.regular_columns)
+        query = (
+            self.db.query_class.into(self.model._meta.basetable)
+            .columns(*[self.model._meta.fields_db_projection[c] for c in self.regular_columns])
+            .insert(
+                *[
+                    tuple(self.Parameter(row * column_count + i) for i in range(column_count))
+                    for row in range(rows)
+                ]
+            )
+        )
+        generated_fields = self.model._meta.generated_db_fields
+        if generated_fields:
+            query = query.returning(*generated_fields)
+        return str(query)
+
     async def _process_insert_result(self, instance: Model, results: Optional[asyncpg.Record]):
         if results:
             generated_fields = self.model._meta.generated_db_fields
             db_projection = instance._meta.fields_db_projection_reverse
             for key, val in zip(generated_fields, results):
                 setattr(instance, db_projection[key], val)
+
+    async def execute_bulk_insert(self, instances: List[Model]) -> None:
+        if not instances or not self.regular_columns:
+            return await super().execute_bulk_insert(instances)
+
+        # Insert as few multi-row VALUES statements as possible,
+        # and hand generated values back to the instances via RETURNING.
+        chunk_size = min(
+            self.BULK_INSERT_MAX_ROWS, self.BULK_INSERT_MAX_PARAMETERS // len(self.regular_columns)
+        )
+        # Only the full-chunk statement is reused, so only that one is cached
+        key = f"{self.db.connection_name}:{self.model._meta.table}:{chunk_size}"
+        queries = []
+        for offset in range(0, len(instances), chunk_size):
+            end = offset + chunk_size
+            chunk = instances[offset:end]
+            if len(chunk) == chunk_size:
+                sql = BULK_INSERT_CACHE.get(key)
+                if sql is None:
+                    sql = BULK_INSERT_CACHE[key] = self._prepare_bulk_insert_statement(chunk_size)
+            else:
+                sql = self._prepare_bulk_insert_statement(len(chunk))
+            values = [
+                self.column_map[column](getattr(instance, column), instance)
+                for instance in chunk
+                for column in self.regular_columns
+            ]
+            queries.append((sql, values))
+
+        results = await cast("AsyncpgDBClient", self.db).execute_many_returning(queries)
+        for instance, result in zip(instances, results):
+            await self._process_insert_result(instance, result)
@@ -4,6 +4,9 @@ from tortoise import fields
 from tortoise.backends.base.schema_generator import BaseSchemaGenerator
 from tortoise.utils import get_escape_translation_table
 
+_ESCAPE_TABLE = get_escape_translation_table()
+_ESCAPE_TABLE[ord("'")] = "''"
+
 
 class AsyncpgSchemaGenerator(BaseSchemaGenerator):
     TABLE_COMMENT_TEMPLATE = "COMMENT ON TABLE \"{table}\" IS '{comment}';"
@@ -31,9 +34,7 @@ class AsyncpgSchemaGenerator(BaseSchemaGenerator):
         return None
 
     def _escape_comment(self, comment: str) -> str:
-        table = get_escape_translation_table()
-        table[ord("'")] = "''"
-        return comment.translate(table)
+        return comment.translate(_ESCAPE_TABLE)
 
     def _table_comment_generator(self, table: str, comment: str) -> str:
         comment = self.TABLE_COMMENT_TEMPLATE.format(
@@ -1,7 +1,6 @@
 import asyncio
 import datetime
 import decimal
-from copy import copy
 from functools import partial
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
 
@@ -43,13 +42,7 @@ class BaseExecutor:
 
             self.column_map: Dict[str, Callable[[Any, Any], Any]] = {}
             for column in self.regular_columns:
-                field_object = self.model._meta.fields_map[column]
-                if field_object.__class__ in self.TO_DB_OVERRIDE:
-                    self.column_map[column] = partial(
-                        self.TO_DB_OVERRIDE[field_object.__class__], field_object
-                    )
-                else:
-                    self.column_map[column] = field_object.to_db_value
+                self.column_map[column] = self.get_to_db_func(self.model._meta.fields_map[column])
 
             table = self.model._meta.basetable
             self.delete_query = str(
@@ -101,10 +94,14 @@ class BaseExecutor:
         return regular_columns, result_columns
 
     @classmethod
-    def _field_to_db(cls, field_object: fields.Field, attr: Any, instance) -> Any:
+    def get_to_db_func(cls, field_object: fields.Field) -> Callable[[Any, Any], Any]:
         if field_object.__class__ in cls.TO_DB_OVERRIDE:
-            return cls.TO_DB_OVERRIDE[field_object.__class__](field_object, attr, instance)
-        return field_object.to_db_value(attr, instance)
+            return partial(cls.TO_DB_OVERRIDE[field_object.__class__], field_object)
+        return field_object.to_db_value
+
+    @classmethod
+    def _field_to_db(cls, field_object: fields.Field, attr: Any, instance) -> Any:
+        return cls.get_to_db_func(field_object)(attr, instance)
 
     def _prepare_insert_statement(self, columns: List[str]) -> str:
         # Insert should implement returning new id to saved object
@@ -250,8 +247,9 @@ class BaseExecutor:
 
         related_query_table = related_query.model._meta.basetable
         related_pk_field = related_query.model._meta.db_pk_field
+        # The pypika builders copy the base query, so it is never mutated here
         query = (
-            related_query.query.join(subquery)
+            related_query.model._meta.basequery.join(subquery)
             .on(subquery._forward_relation_key == related_query_table[related_pk_field])
             .select(
                 subquery._backward_relation_key.as_("_backward_relation_key"),
@@ -261,13 +259,14 @@ class BaseExecutor:
 
         if related_query._q_objects:
             joined_tables: List[Table] = []
-            modifier = QueryModifier()
-            for node in related_query._q_objects:
-                modifier &= node.resolve(
+            modifier = QueryModifier.combine_and(
+                node.resolve(
                     model=related_query.model,
                     annotations=related_query._annotations,
                     custom_filters=related_query._custom_filters,
                 )
+                for node in related_query._q_objects
+            )
 
             where_criterion, joins, having_criterion = modifier.get_query_modifiers()
             for join in joins:
@@ -334,7 +333,6 @@ class BaseExecutor:
                 related_model_field = self.model._meta.fields_map[field]
                 related_model = related_model_field.field_type
                 related_query = related_model.all().using_db(self.db)
-                related_query.query = copy(related_query.model._meta.basequery)
             if forwarded_prefetches:
                 related_query = related_query.prefetch_related(*forwarded_prefetches)
             self._prefetch_queries[field] = related_query
@@ -1,6 +1,9 @@
 import logging
+from collections import defaultdict
+from functools import lru_cache
 from hashlib import sha256
-from typing import List, Optional, Set
+from heapq import heappop, heappush
+from typing import Dict, List, Optional, Tuple
 
 from tortoise import fields
 from tortoise.exceptions import ConfigurationError
@@ -10,6 +13,7 @@ from tortoise.utils import get_escape_translation_table
 # pylint: disable=R0201
 
 logger = logging.getLogger("tortoise")
+_ESCAPE_TABLE = get_escape_translation_table()
 
 
 class BaseSchemaGenerator:
@@ -42,9 +46,12 @@ class BaseSchemaGenerator:
         fields.JSONField: "TEXT",
         fields.UUIDField: "CHAR(36)",
     }
+    # Resolved FIELD_TYPE_MAP templates, keyed by (schema generator class, field class)
+    _FIELD_TYPE_CACHE: Dict[Tuple[type, type], str] = {}
 
     def __init__(self, client) -> None:
         self.client = client
+        self._quoted_fields: Dict[str, str] = {}
 
     def _create_string(
         self, db_field: str, field_type: str, nullable: str, unique: str, is_pk: bool, comment: str
@@ -100,7 +107,7 @@ class BaseSchemaGenerator:
         # This method provides a default method to escape comment strings as per
         # default standard as applied under mysql like database. This can be
         # overwritten if required to match the database specific escaping.
-        return comment.translate(get_escape_translation_table())
+        return comment.translate(_ESCAPE_TABLE)
 
     def _table_generate_extra(self, table: str) -> str:
         return ""
@@ -111,9 +118,23 @@ class BaseSchemaGenerator:
     def quote(self, val: str) -> str:
         return f'"{val}"'
 
+    def _quote_fields(self, field_names: List[str]) -> str:
+        # Quoting is dialect specific, so quoted names are cached per generator.
+        quoted = self._quoted_fields
+        parts = []
+        for field_name in field_names:
+            value = quoted.get(field_name)
+            if value is None:
+                value = quoted[field_name] = self.quote(field_name)
+            parts.append(value)
+        return ", ".join(parts)
+
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _make_hash(*args: str, length: int) -> str:
         # Hash a set of string values and get a digest of the given length.
+        # The digest is part of generated index and FK names, so changing the
+        # algorithm would rename them for existing databases. Keep sha256.
         return sha256(";".join(args).encode("utf-8")).hexdigest()[:length]
 
     def _generate_index_name(self, prefix, model, field_names: List[str]) -> str:
@@ -121,48 +142,43 @@ class BaseSchemaGenerator:
         # characters (Oracle limit).
         # That's why we slice some of the strings here.
         table_name = model._meta.table
-        index_name = "{}_{}_{}_{}".format(
-            prefix,
-            table_name[:11],
-            field_names[0][:7],
-            self._make_hash(table_name, *field_names, length=6),
-        )
-        return index_name
+        hashed = self._make_hash(table_name, *field_names, length=6)
+        return f"{prefix}_{table_name[:11]}_{field_names[0][:7]}_{hashed}"
 
     def _generate_fk_name(self, from_table, from_field, to_table, to_field) -> str:
         # NOTE: for compatibility, index name should not be longer than 30
         # characters (Oracle limit).
         # That's why we slice some of the strings here.
-        index_name = "fk_{f}_{t}_{h}".format(
-            f=from_table[:8],
-            t=to_table[:8],
-            h=self._make_hash(from_table, from_field, to_table, to_field, length=8),
-        )
-        return index_name
+        hashed = self._make_hash(from_table, from_field, to_table, to_field, length=8)
+        return f"fk_{from_table[:8]}_{to_table[:8]}_{hashed}"
 
     def _get_index_sql(self, model, field_names: List[str], safe: bool) -> str:
         return self.INDEX_CREATE_TEMPLATE.format(
             exists="IF NOT EXISTS " if safe else "",
             index_name=self._generate_index_name("idx", model, field_names),
             table_name=model._meta.table,
-            fields=", ".join([self.quote(f) for f in field_names]),
+            fields=self._quote_fields(field_names),
         )
 
     def _get_unique_constraint_sql(self, model, field_names: List[str]) -> str:
         return self.UNIQUE_CONSTRAINT_CREATE_TEMPLATE.format(
             index_name=self._generate_index_name("uid", model, field_names),
-            fields=", ".join([self.quote(f) for f in field_names]),
+            fields=self._quote_fields(field_names),
         )
 
     def _get_field_type(self, field_object) -> str:
-        field_object_type = type(field_object)
-        while (
-            field_object_type.__bases__
-            and field_object_type not in self.FIELD_TYPE_MAP  # type: ignore
-        ):
-            field_object_type = field_object_type.__bases__[0]
-
-        field_type = self.FIELD_TYPE_MAP[field_object_type]  # type: ignore
+        key = (type(self), type(field_object))
+        field_type = self._FIELD_TYPE_CACHE.get(key)
+        if field_type is None:
+            field_object_type = type(field_object)
+            while (
+                field_object_type.__bases__
+                and field_object_type not in self.FIELD_TYPE_MAP  # type: ignore
+            ):
+                field_object_type = field_object_type.__bases__[0]
+
+            field_type = self.FIELD_TYPE_MAP[field_object_type]  # type: ignore
+            self._FIELD_TYPE_CACHE[key] = field_type
 
         if isinstance(field_object, fields.DecimalField):
             field_type = field_type.format(field_object.max_digits, field_object.decimal_places)
@@ -172,17 +188,21 @@ class BaseSchemaGenerator:
         return field_type
 
     def _get_table_sql(self, model, safe=True) -> dict:
+        meta = model._meta
+        table = meta.table
+        fields_map = meta.fields_map
+        exists = "IF NOT EXISTS " if safe else ""
 
         fields_to_create = []
         fields_with_index = []
         m2m_tables_for_create = []
         references = set()
 
-        for field_name, db_field in model._meta.fields_db_projection.items():
-            field_object = model._meta.fields_map[field_name]
+        for field_name, db_field in meta.fields_db_projection.items():
+            field_object = fields_map[field_name]
             comment = (
                 self._column_comment_generator(
-                    table=model._meta.table, column=db_field, comment=field_object.description
+                    table=table, column=db_field, comment=field_object.description
                 )
                 if field_object.description
                 else ""
@@ -197,14 +217,14 @@ class BaseSchemaGenerator:
             nullable = "NOT NULL" if not field_object.null else ""
             unique = "UNIQUE" if field_object.unique else ""
 
-            if hasattr(field_object, "reference") and field_object.reference:
+            if field_object.reference:
+                reference = field_object.reference
+                related_meta = reference.field_type._meta
                 comment = (
                     self._column_comment_generator(
-                        table=model._meta.table,
-                        column=db_field,
-                        comment=field_object.reference.description,
+                        table=table, column=db_field, comment=reference.description
                     )
-                    if field_object.reference.description
+                    if reference.description
                     else ""
                 )
                 field_creation_string = self._create_string(
@@ -216,18 +236,15 @@ class BaseSchemaGenerator:
                     comment="",
                 ) + self._create_fk_string(
                     constraint_name=self._generate_fk_name(
-                        model._meta.table,
-                        db_field,
-                        field_object.reference.field_type._meta.table,
-                        field_object.reference.field_type._meta.db_pk_field,
+                        table, db_field, related_meta.table, related_meta.db_pk_field
                     ),
                     db_field=db_field,
-                    table=field_object.reference.field_type._meta.table,
-                    field=field_object.reference.field_type._meta.db_pk_field,
-                    on_delete=field_object.reference.on_delete,
+                    table=related_meta.table,
+                    field=related_meta.db_pk_field,
+                    on_delete=reference.on_delete,
                     comment=comment,
                 )
-                references.add(field_object.reference.field_type._meta.table)
+                references.add(related_meta.table)
             else:
                 field_creation_string = self._create_string(
                     db_field=db_field,
@@ -243,12 +260,12 @@ class BaseSchemaGenerator:
             if field_object.index:
                 fields_with_index.append(db_field)
 
-        if model._meta.unique_together:
-            for unique_together_list in model._meta.unique_together:
+        if meta.unique_together:
+            for unique_together_list in meta.unique_together:
                 unique_together_to_create = []
 
                 for field in unique_together_list:
-                    field_object = model._meta.fields_map[field]
+                    field_object = fields_map[field]
                     unique_together_to_create.append(field_object.source_field or field)
 
                 fields_to_create.append(
@@ -260,11 +277,11 @@ class BaseSchemaGenerator:
             self._get_index_sql(model, [field_name], safe=safe) for field_name in fields_with_index
         ]
 
-        if model._meta.indexes:
-            for indexes_list in model._meta.indexes:
+        if meta.indexes:
+            for indexes_list in meta.indexes:
                 indexes_to_create = []
                 for field in indexes_list:
-                    field_object = model._meta.fields_map[field]
+                    field_object = fields_map[field]
                     indexes_to_create.append(field_object.source_field or field)
 
                 _indexes.append(self._get_index_sql(model, indexes_to_create, safe=safe))
@@ -273,42 +290,43 @@ class BaseSchemaGenerator:
 
         fields_to_create.extend(self._get_inner_statements())
 
-        table_fields_string = "\n    {}\n".format(",\n    ".join(fields_to_create))
+        table_fields = ",\n    ".join(fields_to_create)
+        table_fields_string = f"\n    {table_fields}\n"
         table_comment = (
-            self._table_comment_generator(
-                table=model._meta.table, comment=model._meta.table_description
-            )
-            if model._meta.table_description
+            self._table_comment_generator(table=table, comment=meta.table_description)
+            if meta.table_description
             else ""
         )
 
         table_create_string = self.TABLE_CREATE_TEMPLATE.format(
-            exists="IF NOT EXISTS " if safe else "",
-            table_name=model._meta.table,
+            exists=exists,
+            table_name=table,
             fields=table_fields_string,
             comment=table_comment,
-            extra=self._table_generate_extra(table=model._meta.table),
+            extra=self._table_generate_extra(table=table),
         )
 
-        table_create_string = "\n".join([table_create_string, *field_indexes_sqls])
-
-        table_create_string += self._post_table_hook()
+        table_create_string = (
+            "\n".join([table_create_string, *field_indexes_sqls]) + self._post_table_hook()
+        )
 
-        for m2m_field in model._meta.m2m_fields:
-            field_object = model._meta.fields_map[m2m_field]
+        m2m_table_template = self.M2M_TABLE_TEMPLATE
+        for m2m_field in meta.m2m_fields:
+            field_object = fields_map[m2m_field]
             if field_object._generated:
                 continue
-            m2m_create_string = self.M2M_TABLE_TEMPLATE.format(
-                exists="IF NOT EXISTS " if safe else "",
+            related_meta = field_object.field_type._meta
+            m2m_create_string = m2m_table_template.format(
+                exists=exists,
                 table_name=field_object.through,
-                backward_table=model._meta.table,
-                forward_table=field_object.field_type._meta.table,
-                backward_field=model._meta.db_pk_field,
-                forward_field=field_object.field_type._meta.db_pk_field,
+                backward_table=table,
+                forward_table=related_meta.table,
+                backward_field=meta.db_pk_field,
+                forward_field=related_meta.db_pk_field,
                 backward_key=field_object.backward_key,
-                backward_type=self._get_field_type(model._meta.pk),
+                backward_type=self._get_field_type(meta.pk),
                 forward_key=field_object.forward_key,
-                forward_type=self._get_field_type(field_object.field_type._meta.pk),
+                forward_type=self._get_field_type(related_meta.pk),
                 extra=self._table_generate_extra(table=field_object.through),
                 comment=self._table_comment_generator(
                     table=field_object.through, comment=field_object.description
@@ -320,7 +338,7 @@ class BaseSchemaGenerator:
             m2m_tables_for_create.append(m2m_create_string)
 
         return {
-            "table": model._meta.table,
+            "table": table,
             "model": model,
             "table_creation_string": table_create_string,
             "references": references,
@@ -341,33 +359,38 @@ class BaseSchemaGenerator:
 
         self._get_models_to_create(models_to_create)
 
-        tables_to_create = []
-        for model in models_to_create:
-            tables_to_create.append(self._get_table_sql(model, safe))
-
-        tables_to_create_count = len(tables_to_create)
-
-        created_tables: Set[dict] = set()
-        ordered_tables_for_create: List[str] = []
+        tables_to_create = [self._get_table_sql(model, safe) for model in models_to_create]
+
+        # Topological sort (Kahn's algorithm) on FK references.
+        # Ready tables are taken in declaration order to keep the output stable.
+        outstanding: List[int] = []
+        dependents: Dict[str, List[int]] = defaultdict(list)
+        ready: List[int] = []
+        for index, table in enumerate(tables_to_create):
+            references = table["references"] - {table["table"]}
+            for reference in references:
+                dependents[reference].append(index)
+            outstanding.append(len(references))
+            if not references:
+                ready.append(index)
+
+        schema_parts: List[str] = []
         m2m_tables_to_create: List[str] = []
-        while True:
-            if len(created_tables) == tables_to_create_count:
-                break
-            try:
-                next_table_for_create = next(
-                    t
-                    for t in tables_to_create
-                    if t["references"].issubset(created_tables | {t["table"]})
-                )
-            except StopIteration:
-                raise ConfigurationError("Can't create schema due to cyclic fk references")
-            tables_to_create.remove(next_table_for_create)
-            created_tables.add(next_table_for_create["table"])
-            ordered_tables_for_create.append(next_table_for_create["table_creation_string"])
-            m2m_tables_to_create += next_table_for_create["m2m_tables"]
-
-        schema_creation_string = "\n".join(ordered_tables_for_create + m2m_tables_to_create)
-        return schema_creation_string
+        while ready:
+            table = tables_to_create[heappop(ready)]
+            schema_parts.append(table["table_creation_string"])
+            m2m_tables_to_create.extend(table["m2m_tables"])
+            for dependent in dependents.pop(table["table"], []):
+                outstanding[dependent] -= 1
+                if not outstanding[dependent]:
+                    heappush(ready, dependent)
+
+        if len(schema_parts) != len(tables_to_create):
+            raise ConfigurationError("Can't create schema due to cyclic fk references")
+
+        # M2M tables go last, once every table they reference exists
+        schema_parts.extend(m2m_tables_to_create)
+        return "\n".join(schema_parts)
 
     async def generate_from_string(self, creation_string: str) -> None:
         # print(creation_string)
@@ -65,7 +65,7 @@ class MySQLSchemaGenerator(BaseSchemaGenerator):
                 exists="IF NOT EXISTS " if safe else "",
                 index_name=self._generate_index_name("idx", model, field_names),
                 table_name=model._meta.table,
-                fields=", ".join([self.quote(f) for f in field_names]),
+                fields=self._quote_fields(field_names),
             )
         )
         return ""
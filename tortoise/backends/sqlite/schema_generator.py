@@ -3,6 +3,14 @@ from typing import Optional
 from tortoise import fields
 from tortoise.backends.base.schema_generator import BaseSchemaGenerator
 
+_ESCAPE_TABLE = [chr(x) for x in range(128)]
+_ESCAPE_TABLE[0] = "\\0"
+_ESCAPE_TABLE[ord("\\")] = "\\\\"
+_ESCAPE_TABLE[ord("\n")] = "\\n"
+_ESCAPE_TABLE[ord("\r")] = "\\r"
+_ESCAPE_TABLE[ord("\032")] = "\\Z"
+_ESCAPE_TABLE[ord("/")] = "\\/"
+
 
 class SqliteSchemaGenerator(BaseSchemaGenerator):
     FIELD_TYPE_MAP = {
@@ -16,14 +24,7 @@ class SqliteSchemaGenerator(BaseSchemaGenerator):
         # This method provides a default method to escape comment strings as per
         # default standard as applied under mysql like database. This can be
         # overwritten if required to match the database specific escaping.
-        _escape_table = [chr(x) for x in range(128)]
-        _escape_table[0] = "\\0"
-        _escape_table[ord("\\")] = "\\\\"
-        _escape_table[ord("\n")] = "\\n"
-        _escape_table[ord("\r")] = "\\r"
-        _escape_table[ord("\032")] = "\\Z"
-        _escape_table[ord("/")] = "\\/"
-        return comment.translate(_escape_table)
+        return comment.translate(_ESCAPE_TABLE)
 
     def _get_primary_key_create_string(
         self, field_object: fields.Field, field_name: str, comment: str
@@ -1,6 +1,19 @@
+import operator
 from copy import copy, deepcopy
 from functools import partial
-from typing import Any, Dict, Generator, List, Optional, Set, Tuple, Type, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from pypika import Query, Table
 
@@ -87,6 +100,8 @@ class MetaInfo:
         "basequery_all_fields",
         "basetable",
         "_filters",
+        "_filter_key_kinds",
+        "_simple_filters",
         "unique_together",
         "indexes",
         "pk_attr",
@@ -118,6 +133,8 @@ class MetaInfo:
         self.fields_db_projection_reverse: Dict[str, str] = {}
         self._filters: Dict[str, Dict[str, dict]] = {}
         self.filters: Dict[str, dict] = {}
+        self._filter_key_kinds: Dict[str, str] = {}
+        self._simple_filters: Dict[str, Tuple[str, Callable]] = {}
         self.fields_map: Dict[str, fields.Field] = {}
         self._inited: bool = False
         self.default_connection: Optional[str] = None
@@ -305,7 +322,9 @@ class MetaInfo:
                 self.db_default_fields.append((key, model_field, field))
 
     def _generate_filters(self) -> None:
-        get_overridden_filter_func = self.db.executor_class.get_overridden_filter_func
+        executor_class = self.db.executor_class
+        get_overridden_filter_func = executor_class.get_overridden_filter_func
+        self._simple_filters.clear()
         for key, filter_info in self._filters.items():
             overridden_operator = get_overridden_filter_func(
                 filter_func=filter_info["operator"]  # type: ignore
@@ -315,6 +334,24 @@ class MetaInfo:
                 filter_info["operator"] = overridden_operator  # type: ignore
             self.filters[key] = filter_info
 
+            # Plain equality on a column of this table,
+            # resolve its to-DB converter up front for the _process_filter_kwarg fast path.
+            if (
+                cast(Callable, filter_info["operator"]) is operator.eq
+                and "table" not in filter_info
+                and "value_encoder" not in filter_info
+            ):
+                to_db: Callable[[Any, Any], Any] = executor_class.get_to_db_func(
+                    self.fields_map[filter_info["field"]]  # type: ignore
+                )
+                self._simple_filters[key] = (filter_info["source_field"], to_db)  # type: ignore
+
+        # Classify every statically known filter key up front,
+        # so filter resolution can route a key with a single dict lookup.
+        self._filter_key_kinds = dict.fromkeys(self.filters, "filter")
+        self._filter_key_kinds.update(dict.fromkeys(self.m2m_fields, "m2m"))
+        self._filter_key_kinds.update(dict.fromkeys(self.fk_fields | self.o2o_fields, "fk"))
+
 
 class ModelMeta(type):
     __slots__ = ()
@@ -650,6 +687,9 @@ class Model(metaclass=ModelMeta):
 
             e.g. ``IntField`` primary keys will not be populated.
 
+            On PostgreSQL the objects are inserted with multi-row ``INSERT`` statements,
+            and generated fields (such as ``IntField`` primary keys) are populated.
+
         This is recommend only for throw away inserts where you want to ensure optimal
         insert performance.
 
@@ -1,5 +1,6 @@
-from copy import copy
-from typing import Any, Dict, List, Optional, Tuple
+from functools import reduce
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from pypika import Table
 from pypika.terms import Criterion
@@ -7,10 +8,20 @@ from pypika.terms import Criterion
 from tortoise import fields
 from tortoise.exceptions import FieldError, OperationalError
 
+# Filter functions resolved against FILTER_FUNC_OVERRIDE,
+# keyed by (executor class, filter function)
+_OVERRIDDEN_FILTER_FUNCS: Dict[Tuple[type, Callable], Callable] = {}
+
 
 def _process_filter_kwarg(model, key, value) -> Tuple[Criterion, Optional[Tuple[Table, Criterion]]]:
-    join = None
     table = model._meta.basetable
+    if value is not None:
+        simple_filter = model._meta._simple_filters.get(key)
+        if simple_filter:
+            source_field, to_db = simple_filter
+            return table[source_field] == to_db(value, model), None
+
+    join = None
 
     if value is None and f"{key}__isnull" in model._meta.filters:
         param = model._meta.get_filter(f"{key}__isnull")
@@ -98,18 +109,24 @@ class EmptyCriterion(Criterion):  # type: ignore
 
 
 def _and(left: Criterion, right: Criterion):
-    if left and not right:
+    if not left:
+        return right
+    if not right:
         return left
     return left & right
 
 
 def _or(left: Criterion, right: Criterion):
-    if left and not right:
+    if not left:
+        return right
+    if not right:
         return left
     return left | right
 
 
 class QueryModifier:
+    __slots__ = ("where_criterion", "joins", "having_criterion")
+
     def __init__(
         self,
         where_criterion: Optional[Criterion] = None,
@@ -148,6 +165,48 @@ class QueryModifier:
                 joins=self.joins + other.joins,
             )
 
+    @classmethod
+    def combine_and(cls, modifiers: Iterable["QueryModifier"]) -> "QueryModifier":
+        """
+        Combines the modifiers as if chained with ``&``, without the intermediate modifiers.
+        """
+        modifiers = list(modifiers)
+        return cls(
+            where_criterion=reduce(
+                _and, [modifier.where_criterion for modifier in modifiers], EmptyCriterion()
+            ),
+            joins=list(chain.from_iterable(modifier.joins for modifier in modifiers)),
+            having_criterion=reduce(
+                _and, [modifier.having_criterion for modifier in modifiers], EmptyCriterion()
+            ),
+        )
+
+    @classmethod
+    def combine_or(cls, modifiers: Iterable["QueryModifier"]) -> "QueryModifier":
+        """
+        Combines the modifiers as if chained with ``|``, without the intermediate modifiers.
+        """
+        modifiers = list(modifiers)
+        joins = list(chain.from_iterable(modifier.joins for modifier in modifiers))
+        if any(modifier.having_criterion for modifier in modifiers):
+            return cls(
+                joins=joins,
+                having_criterion=reduce(
+                    _or,
+                    [
+                        _and(modifier.where_criterion, modifier.having_criterion)
+                        for modifier in modifiers
+                    ],
+                    EmptyCriterion(),
+                ),
+            )
+        return cls(
+            where_criterion=reduce(
+                _or, [modifier.where_criterion for modifier in modifiers], EmptyCriterion()
+            ),
+            joins=joins,
+        )
+
     def __invert__(self) -> "QueryModifier":
         if not self.where_criterion and not self.having_criterion:
             return QueryModifier(joins=self.joins)
@@ -210,13 +269,14 @@ class Q:
     def negate(self) -> None:
         self._is_negated = not self._is_negated
 
-    def _resolve_nested_filter(self, model, key, value) -> QueryModifier:
+    def _resolve_nested_filter(
+        self, model, related_field_name: str, nested_key: str, value
+    ) -> QueryModifier:
         table = model._meta.basetable
 
-        related_field_name = key.split("__")[0]
         related_field = model._meta.fields_map[related_field_name]
         required_joins = _get_joins_for_related_field(table, related_field, related_field_name)
-        modifier = Q(**{"__".join(key.split("__")[1:]): value}).resolve(
+        modifier = Q(**{nested_key: value}).resolve(
             model=related_field.field_type,
             annotations=self._annotations,
             custom_filters=self._custom_filters,
@@ -228,12 +288,15 @@ class Q:
         having_info = self._custom_filters[key]
         annotation = self._annotations[having_info["field"]]
         annotation_info = annotation.resolve(model)
-        operator = having_info["operator"]
-        overridden_operator = model._meta.db.executor_class.get_overridden_filter_func(
-            filter_func=operator
-        )
-        if overridden_operator:
-            operator = overridden_operator
+        executor_class = model._meta.db.executor_class
+        cache_key = (executor_class, having_info["operator"])
+        operator = _OVERRIDDEN_FILTER_FUNCS.get(cache_key)
+        if operator is None:
+            operator = (
+                executor_class.get_overridden_filter_func(filter_func=having_info["operator"])
+                or having_info["operator"]
+            )
+            _OVERRIDDEN_FILTER_FUNCS[cache_key] = operator
         if annotation_info["field"].is_aggregate:
             modifier = QueryModifier(having_criterion=operator(annotation_info["field"], value))
         else:
@@ -241,8 +304,9 @@ class Q:
         return modifier
 
     def _resolve_regular_kwarg(self, model, key, value) -> QueryModifier:
-        if key not in model._meta.filters and key.split("__")[0] in model._meta.fetch_fields:
-            modifier = self._resolve_nested_filter(model, key, value)
+        related_field_name, _, nested_key = key.partition("__")
+        if key not in model._meta.filters and related_field_name in model._meta.fetch_fields:
+            modifier = self._resolve_nested_filter(model, related_field_name, nested_key, value)
         else:
             criterion, join = _process_filter_kwarg(model, key, value)
             joins = [join] if join else []
@@ -250,23 +314,24 @@ class Q:
         return modifier
 
     def _get_actual_filter_params(self, model, key, value) -> Tuple[str, Any]:
-        if key in model._meta.fk_fields or key in model._meta.o2o_fields:
+        filter_key_kind = model._meta._filter_key_kinds.get(key)
+        if filter_key_kind == "fk":
             field_object = model._meta.fields_map[key]
             if hasattr(value, "pk"):
                 filter_value = value.pk
             else:
                 filter_value = value
             filter_key = field_object.source_field
-        elif key in model._meta.m2m_fields:
+        elif filter_key_kind == "m2m":
             filter_key = key
             if hasattr(value, "pk"):
                 filter_value = value.pk
             else:
                 filter_value = value
         elif (
-            key.split("__")[0] in model._meta.fetch_fields
+            filter_key_kind == "filter"
             or key in self._custom_filters
-            or key in model._meta.filters
+            or key.partition("__")[0] in model._meta.fetch_fields
         ):
             filter_key = key
             filter_value = value
@@ -278,30 +343,30 @@ class Q:
         return filter_key, filter_value
 
     def _resolve_kwargs(self, model) -> QueryModifier:
-        modifier = QueryModifier()
+        modifiers = []
         for raw_key, raw_value in self.filters.items():
             key, value = self._get_actual_filter_params(model, raw_key, raw_value)
             if key in self._custom_filters:
-                filter_modifier = self._resolve_custom_kwarg(model, key, value)
+                modifiers.append(self._resolve_custom_kwarg(model, key, value))
             else:
-                filter_modifier = self._resolve_regular_kwarg(model, key, value)
+                modifiers.append(self._resolve_regular_kwarg(model, key, value))
 
-            if self.join_type == self.AND:
-                modifier &= filter_modifier
-            else:
-                modifier |= filter_modifier
+        if self.join_type == self.AND:
+            modifier = QueryModifier.combine_and(modifiers)
+        else:
+            modifier = QueryModifier.combine_or(modifiers)
         if self._is_negated:
             modifier = ~modifier
         return modifier
 
     def _resolve_children(self, model) -> QueryModifier:
-        modifier = QueryModifier()
-        for node in self.children:
-            node_modifier = node.resolve(model, self._annotations, self._custom_filters)
-            if self.join_type == self.AND:
-                modifier &= node_modifier
-            else:
-                modifier |= node_modifier
+        modifiers = [
+            node.resolve(model, self._annotations, self._custom_filters) for node in self.children
+        ]
+        if self.join_type == self.AND:
+            modifier = QueryModifier.combine_and(modifiers)
+        else:
+            modifier = QueryModifier.combine_or(modifiers)
 
         if self._is_negated:
             modifier = ~modifier
@@ -321,7 +386,6 @@ class Prefetch:
     def __init__(self, relation, queryset) -> None:
         self.relation = relation
         self.queryset = queryset
-        self.queryset.query = copy(self.queryset.model._meta.basequery)
 
     def resolve_for_queryset(self, queryset) -> None:
         relation_split = self.relation.split("__")
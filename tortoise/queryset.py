@@ -57,9 +57,9 @@ class AwaitableQuery(QuerySetIterable[MODEL]):
         self.capabilities: Capabilities = model._meta.db.capabilities
 
     def resolve_filters(self, model, q_objects, annotations, custom_filters) -> None:
-        modifier = QueryModifier()
-        for node in q_objects:
-            modifier &= node.resolve(model, annotations, custom_filters)
+        modifier = QueryModifier.combine_and(
+            node.resolve(model, annotations, custom_filters) for node in q_objects
+        )
 
         where_criterion, joins, having_criterion = modifier.get_query_modifiers()
         for join in joins: